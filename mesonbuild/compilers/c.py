@@ -38,9 +38,46 @@ from .compilers import (
 if typing.TYPE_CHECKING:
     from ..envconfig import MachineInfo
 
+# Argument lists defined at module or class level in this file are shared by
+# every compiler instance and returned as-is by their getters, so neither this
+# module nor callers may modify them in place.
+gnu_default_warn_args = ['-Wall', '-Winvalid-pch']
+gnu_warn_args = {'0': [],
+                 '1': gnu_default_warn_args,
+                 '2': gnu_default_warn_args + ['-Wextra'],
+                 '3': gnu_default_warn_args + ['-Wextra', '-Wpedantic']}  # type: typing.Dict[str, typing.List[str]]
+
+intel_default_warn_args = ['-Wall', '-w3', '-diag-disable:remark']
+intel_warn_args = {'0': [],
+                   '1': intel_default_warn_args,
+                   '2': intel_default_warn_args + ['-Wextra'],
+                   '3': intel_default_warn_args + ['-Wextra']}  # type: typing.Dict[str, typing.List[str]]
+
+# C standards understood by every supported GCC and Clang version, newer
+# standards are appended per compiler version in __init__ when building
+# _c_std_choices
+gnu_base_c_stds = ('c89', 'c99', 'c11')
+gnu_base_g_stds = ('gnu89', 'gnu99', 'gnu11')
+
+# 'class' is a C++ keyword, so this also catches a C++ compiler set as CC
+sanity_check_code = 'int main(void) { int class=0; return class; }\n'
+
+has_header_symbol_template = '''%(prefix)s
+#include <%(header)s>
+int main(void) {
+    /* If it's not defined as a macro, try to use as a symbol */
+    #ifndef %(symbol)s
+        %(symbol)s;
+    #endif
+    return 0;
+}'''
+
 
 class CCompiler(CLikeCompiler, Compiler):
 
+    # Returned as-is by get_no_stdinc_args(), see the note on shared lists above
+    no_stdinc_args = ['-nostdinc']
+
     @staticmethod
     def attribute_check_func(name):
         try:
@@ -54,27 +91,19 @@ class CCompiler(CLikeCompiler, Compiler):
         self.language = 'c'
         Compiler.__init__(self, exelist, version, for_machine, info, **kwargs)
         CLikeCompiler.__init__(self, is_cross, exe_wrapper)
+        # The host is Windows or Cygwin, only consulted for GCC's c_winlibs
+        self._is_windows_like = info.is_windows() or info.is_cygwin()
 
     def get_no_stdinc_args(self):
-        return ['-nostdinc']
+        return self.no_stdinc_args
 
     def sanity_check(self, work_dir, environment):
-        code = 'int main(void) { int class=0; return class; }\n'
-        return self.sanity_check_impl(work_dir, environment, 'sanitycheckc.c', code)
+        return self.sanity_check_impl(work_dir, environment, 'sanitycheckc.c', sanity_check_code)
 
     def has_header_symbol(self, hname, symbol, prefix, env, *, extra_args=None, dependencies=None):
         fargs = {'prefix': prefix, 'header': hname, 'symbol': symbol}
-        t = '''{prefix}
-        #include <{header}>
-        int main(void) {{
-            /* If it's not defined as a macro, try to use as a symbol */
-            #ifndef {symbol}
-                {symbol};
-            #endif
-            return 0;
-        }}'''
-        return self.compiles(t.format(**fargs), env, extra_args=extra_args,
-                             dependencies=dependencies)
+        return self.compiles(has_header_symbol_template % fargs, env,
+                             extra_args=extra_args, dependencies=dependencies)
 
 
 class ClangCCompiler(ClangCompiler, CCompiler):
@@ -82,39 +111,34 @@ class ClangCCompiler(ClangCompiler, CCompiler):
     _C17_VERSION = '>=6.0.0'
     _C18_VERSION = '>=8.0.0'
 
+    warn_args = gnu_warn_args
+
     def __init__(self, exelist, version, for_machine: MachineChoice,
                  is_cross, info: 'MachineInfo', exe_wrapper=None, **kwargs):
         CCompiler.__init__(self, exelist, version, for_machine, is_cross, info, exe_wrapper, **kwargs)
         ClangCompiler.__init__(self)
-        default_warn_args = ['-Wall', '-Winvalid-pch']
-        self.warn_args = {'0': [],
-                          '1': default_warn_args,
-                          '2': default_warn_args + ['-Wextra'],
-                          '3': default_warn_args + ['-Wextra', '-Wpedantic']}
+        c_stds = gnu_base_c_stds
+        g_stds = gnu_base_g_stds
+        # https://releases.llvm.org/6.0.0/tools/clang/docs/ReleaseNotes.html
+        # https://en.wikipedia.org/wiki/Xcode#Latest_versions
+        if version_compare(version, self._C17_VERSION):
+            c_stds += ('c17',)
+            g_stds += ('gnu17',)
+        if version_compare(version, self._C18_VERSION):
+            c_stds += ('c18',)
+            g_stds += ('gnu18',)
+        self._c_std_choices = ('none',) + c_stds + g_stds
 
     def get_options(self):
         opts = CCompiler.get_options(self)
-        c_stds = ['c89', 'c99', 'c11']
-        g_stds = ['gnu89', 'gnu99', 'gnu11']
-        # https://releases.llvm.org/6.0.0/tools/clang/docs/ReleaseNotes.html
-        # https://en.wikipedia.org/wiki/Xcode#Latest_versions
-        if version_compare(self.version, self._C17_VERSION):
-            c_stds += ['c17']
-            g_stds += ['gnu17']
-        if version_compare(self.version, self._C18_VERSION):
-            c_stds += ['c18']
-            g_stds += ['gnu18']
         opts.update({'c_std': coredata.UserComboOption('C language standard to use',
-                                                       ['none'] + c_stds + g_stds,
+                                                       list(self._c_std_choices),
                                                        'none')})
         return opts
 
     def get_option_compile_args(self, options):
-        args = []
-        std = options['c_std']
-        if std.value != 'none':
-            args.append('-std=' + std.value)
-        return args
+        std = options['c_std'].value
+        return ['-std=' + std] if std != 'none' else []
 
     def get_option_link_args(self, options):
         return []
@@ -144,16 +168,14 @@ class EmscriptenCCompiler(LinkerEnvVarsMixin, EmscriptenMixin, BasicLinkerIsComp
 
 
 class ArmclangCCompiler(ArmclangCompiler, CCompiler):
+
+    warn_args = gnu_warn_args
+
     def __init__(self, exelist, version, for_machine: MachineChoice,
                  info: 'MachineInfo', is_cross, exe_wrapper=None, **kwargs):
         CCompiler.__init__(self, exelist, version, for_machine, is_cross,
                            info, exe_wrapper, **kwargs)
         ArmclangCompiler.__init__(self)
-        default_warn_args = ['-Wall', '-Winvalid-pch']
-        self.warn_args = {'0': [],
-                          '1': default_warn_args,
-                          '2': default_warn_args + ['-Wextra'],
-                          '3': default_warn_args + ['-Wextra', '-Wpedantic']}
 
     def get_options(self):
         opts = CCompiler.get_options(self)
@@ -164,56 +186,48 @@ class ArmclangCCompiler(ArmclangCompiler, CCompiler):
         return opts
 
     def get_option_compile_args(self, options):
-        args = []
-        std = options['c_std']
-        if std.value != 'none':
-            args.append('-std=' + std.value)
-        return args
+        std = options['c_std'].value
+        return ['-std=' + std] if std != 'none' else []
 
     def get_option_link_args(self, options):
         return []
 
 
 class GnuCCompiler(GnuCompiler, CCompiler):
+
+    warn_args = gnu_warn_args
+
     def __init__(self, exelist, version, for_machine: MachineChoice,
                  is_cross, info: 'MachineInfo', exe_wrapper=None,
                  defines=None, **kwargs):
         CCompiler.__init__(self, exelist, version, for_machine, is_cross,
                            info, exe_wrapper, **kwargs)
         GnuCompiler.__init__(self, defines)
-        default_warn_args = ['-Wall', '-Winvalid-pch']
-        self.warn_args = {'0': [],
-                          '1': default_warn_args,
-                          '2': default_warn_args + ['-Wextra'],
-                          '3': default_warn_args + ['-Wextra', '-Wpedantic']}
+        c_stds = gnu_base_c_stds
+        g_stds = gnu_base_g_stds
+        if version_compare(version, '>=8.0.0'):
+            c_stds += ('c17', 'c18')
+            g_stds += ('gnu17', 'gnu18')
+        self._c_std_choices = ('none',) + c_stds + g_stds
 
     def get_options(self):
         opts = CCompiler.get_options(self)
-        c_stds = ['c89', 'c99', 'c11']
-        g_stds = ['gnu89', 'gnu99', 'gnu11']
-        v = '>=8.0.0'
-        if version_compare(self.version, v):
-            c_stds += ['c17', 'c18']
-            g_stds += ['gnu17', 'gnu18']
         opts.update({'c_std': coredata.UserComboOption('C language standard to use',
-                                                       ['none'] + c_stds + g_stds,
+                                                       list(self._c_std_choices),
                                                        'none')})
-        if self.info.is_windows() or self.info.is_cygwin():
+        if self._is_windows_like:
             opts.update({
                 'c_winlibs': coredata.UserArrayOption('Standard Win libraries to link against',
                                                       gnu_winlibs), })
         return opts
 
     def get_option_compile_args(self, options):
-        args = []
-        std = options['c_std']
-        if std.value != 'none':
-            args.append('-std=' + std.value)
-        return args
+        std = options['c_std'].value
+        return ['-std=' + std] if std != 'none' else []
 
     def get_option_link_args(self, options):
-        if self.info.is_windows() or self.info.is_cygwin():
-            return options['c_winlibs'].value[:]
+        if self._is_windows_like:
+            return options['c_winlibs'].value
         return []
 
     def get_pch_use_args(self, pch_dir, header):
@@ -247,45 +261,42 @@ class ElbrusCCompiler(GnuCCompiler, ElbrusCompiler):
 
     # Elbrus C compiler does not have lchmod, but there is only linker warning, not compiler error.
     # So we should explicitly fail at this case.
+    unsupported_functions = frozenset(['lchmod'])
+
     def has_function(self, funcname, prefix, env, *, extra_args=None, dependencies=None):
-        if funcname == 'lchmod':
+        if funcname in self.unsupported_functions:
             return False, False
-        else:
-            return super().has_function(funcname, prefix, env,
-                                        extra_args=extra_args,
-                                        dependencies=dependencies)
+        return super().has_function(funcname, prefix, env,
+                                    extra_args=extra_args,
+                                    dependencies=dependencies)
 
 
 class IntelCCompiler(IntelGnuLikeCompiler, CCompiler):
+
+    warn_args = intel_warn_args
+
     def __init__(self, exelist, version, for_machine: MachineChoice,
                  is_cross, info: 'MachineInfo', exe_wrapper=None, **kwargs):
         CCompiler.__init__(self, exelist, version, for_machine, is_cross,
                            info, exe_wrapper, **kwargs)
         IntelGnuLikeCompiler.__init__(self)
         self.lang_header = 'c-header'
-        default_warn_args = ['-Wall', '-w3', '-diag-disable:remark']
-        self.warn_args = {'0': [],
-                          '1': default_warn_args,
-                          '2': default_warn_args + ['-Wextra'],
-                          '3': default_warn_args + ['-Wextra']}
+        c_stds = ('c89', 'c99')
+        g_stds = ('gnu89', 'gnu99')
+        if version_compare(version, '>=16.0.0'):
+            c_stds += ('c11',)
+        self._c_std_choices = ('none',) + c_stds + g_stds
 
     def get_options(self):
         opts = CCompiler.get_options(self)
-        c_stds = ['c89', 'c99']
-        g_stds = ['gnu89', 'gnu99']
-        if version_compare(self.version, '>=16.0.0'):
-            c_stds += ['c11']
         opts.update({'c_std': coredata.UserComboOption('C language standard to use',
-                                                       ['none'] + c_stds + g_stds,
+                                                       list(self._c_std_choices),
                                                        'none')})
         return opts
 
     def get_option_compile_args(self, options):
-        args = []
-        std = options['c_std']
-        if std.value != 'none':
-            args.append('-std=' + std.value)
-        return args
+        std = options['c_std'].value
+        return ['-std=' + std] if std != 'none' else []
 
 
 class VisualStudioLikeCCompilerMixin:
@@ -299,7 +310,7 @@ class VisualStudioLikeCCompilerMixin:
         return opts
 
     def get_option_link_args(self, options):
-        return options['c_winlibs'].value[:]
+        return options['c_winlibs'].value
 
 
 class VisualStudioCCompiler(VisualStudioLikeCompiler, VisualStudioLikeCCompilerMixin, CCompiler):
@@ -369,14 +380,19 @@ class ArmCCompiler(ArmCompiler, CCompiler):
         return opts
 
     def get_option_compile_args(self, options):
-        args = []
-        std = options['c_std']
-        if std.value != 'none':
-            args.append('--' + std.value)
-        return args
+        std = options['c_std'].value
+        return ['--' + std] if std != 'none' else []
 
 
 class CcrxCCompiler(CcrxCompiler, CCompiler):
+
+    # Returned as-is by the getters below, see the note on shared lists above
+    always_args = ['-nologo']
+    no_optimization_args = ['-optimize=0']
+    werror_args = ['-change_message=error']
+    std_args = {'c89': ['-lang=c'],
+                'c99': ['-lang=c99']}  # type: typing.Dict[str, typing.List[str]]
+
     def __init__(self, exelist, version, for_machine: MachineChoice,
                  is_cross, info: 'MachineInfo', exe_wrapper=None, **kwargs):
         CCompiler.__init__(self, exelist, version, for_machine, is_cross,
@@ -385,7 +401,7 @@ class CcrxCCompiler(CcrxCompiler, CCompiler):
 
     # Override CCompiler.get_always_args
     def get_always_args(self):
-        return ['-nologo']
+        return self.always_args
 
     def get_options(self):
         opts = CCompiler.get_options(self)
@@ -395,25 +411,19 @@ class CcrxCCompiler(CcrxCompiler, CCompiler):
         return opts
 
     def get_option_compile_args(self, options):
-        args = []
-        std = options['c_std']
-        if std.value == 'c89':
-            args.append('-lang=c')
-        elif std.value == 'c99':
-            args.append('-lang=c99')
-        return args
+        return self.std_args.get(options['c_std'].value, [])
 
     def get_compile_only_args(self):
         return []
 
     def get_no_optimization_args(self):
-        return ['-optimize=0']
+        return self.no_optimization_args
 
     def get_output_args(self, target):
         return ['-output=obj=%s' % target]
 
     def get_werror_args(self):
-        return ['-change_message=error']
+        return self.werror_args
 
     def get_include_args(self, path, is_system):
         if path == '':
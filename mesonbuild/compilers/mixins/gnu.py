@@ -311,17 +311,21 @@ class GnuCompiler(GnuLikeCompiler):
         self.id = 'gcc'
         self.defines = defines or {}
         self.base_options.append('b_colorout')
+        # These are queried for every target, so only compare versions once
+        self._has_color_support = mesonlib.version_compare(self.version, '>=4.9.0')
+        # -Wpedantic was added in 4.8.0
+        # https://gcc.gnu.org/gcc-4.8/changes.html
+        self._has_wpedantic = mesonlib.version_compare(self.version, '>=4.8.0')
 
     def get_colorout_args(self, colortype: str) -> typing.List[str]:
-        if mesonlib.version_compare(self.version, '>=4.9.0'):
+        if self._has_color_support:
             return gnu_color_args[colortype][:]
         return []
 
     def get_warn_args(self, level: str) -> typing.List[str]:
         args = super().get_warn_args(level)
-        if mesonlib.version_compare(self.version, '<4.8.0') and '-Wpedantic' in args:
-            # -Wpedantic was added in 4.8.0
-            # https://gcc.gnu.org/gcc-4.8/changes.html
+        if not self._has_wpedantic and '-Wpedantic' in args:
+            args = args[:]
             args[args.index('-Wpedantic')] = '-pedantic'
         return args
 
@@ -14,6 +14,7 @@
 
 from .. import mlog
 import contextlib
+import functools
 import urllib.request
 import urllib.error
 import os
@@ -41,15 +42,20 @@ except ImportError:
     API_ROOT = 'http://wrapdb.mesonbuild.com/v1/'
 
 req_timeout = 600.0
+# Block size used when downloading and when hashing files
+req_blocksize = 128 * 1024
 ssl_warning_printed = False
 
+@functools.lru_cache(maxsize=None)
 def build_ssl_context() -> 'ssl.SSLContext':
-    ctx = ssl.SSLContext(ssl.PROTOCOL_SSLv23)
-    ctx.options |= ssl.OP_NO_SSLv2
-    ctx.options |= ssl.OP_NO_SSLv3
-    ctx.verify_mode = ssl.CERT_REQUIRED
-    ctx.load_default_certs()
-    return ctx
+    # urlopen() creates a new context, and loads the system certificates into
+    # it, for every connection unless one is passed in. Share a single one.
+    return ssl.create_default_context()
+
+def urlopen(urlstring: str) -> 'http.client.HTTPResponse':
+    if has_ssl:
+        return urllib.request.urlopen(urlstring, timeout=req_timeout, context=build_ssl_context())
+    return urllib.request.urlopen(urlstring, timeout=req_timeout)
 
 def quiet_git(cmd: typing.List[str], workingdir: str) -> typing.Tuple[bool, str]:
     try:
@@ -61,11 +67,18 @@ def quiet_git(cmd: typing.List[str], workingdir: str) -> typing.Tuple[bool, str]
         return False, pc.stderr
     return True, pc.stdout
 
+@functools.lru_cache(maxsize=None)
+def is_git_repo(workingdir: str) -> bool:
+    # Checked for every subproject that is not yet in place, but the answer
+    # only depends on the subprojects directory, so ask git once per run.
+    ret, _ = quiet_git(['rev-parse'], workingdir)
+    return ret
+
 def open_wrapdburl(urlstring: str) -> 'http.client.HTTPResponse':
     global ssl_warning_printed
     if has_ssl:
         try:
-            return urllib.request.urlopen(urlstring, timeout=req_timeout)# , context=build_ssl_context())
+            return urlopen(urlstring)
         except urllib.error.URLError:
             if not ssl_warning_printed:
                 print('SSL connection failed. Falling back to unencrypted connections.', file=sys.stderr)
@@ -118,7 +131,15 @@ class PackageDefinition:
     def has_patch(self) -> bool:
         return 'patch_url' in self.values
 
+@functools.lru_cache(maxsize=None)
+def cached_package_definition(fname: str, mtime_ns: int, size: int) -> PackageDefinition:
+    # mtime_ns and size are only part of the cache key, so that a wrap file
+    # edited between two resolves is parsed again
+    return PackageDefinition(fname)
+
 class Resolver:
+    hex_digits = frozenset('0123456789abcdefABCDEF')
+
     def __init__(self, subdir_root: str, wrap_mode=WrapMode.default):
         self.wrap_mode = wrap_mode
         self.subdir_root = subdir_root
@@ -182,9 +203,13 @@ class Resolver:
 
     def load_wrap(self) -> PackageDefinition:
         fname = os.path.join(self.subdir_root, self.packagename + '.wrap')
-        if os.path.isfile(fname):
-            return PackageDefinition(fname)
-        return None
+        try:
+            st = os.stat(fname)
+        except OSError:
+            return None
+        if not stat.S_ISREG(st.st_mode):
+            return None
+        return cached_package_definition(fname, st.st_mtime_ns, st.st_size)
 
     def check_can_download(self) -> None:
         # Don't download subproject data based on wrap file if requested.
@@ -195,8 +220,7 @@ class Resolver:
 
     def resolve_git_submodule(self) -> bool:
         # Are we in a git repository?
-        ret, out = quiet_git(['rev-parse'], self.subdir_root)
-        if not ret:
+        if not is_git_repo(self.subdir_root):
             return False
         # Is `dirname` a submodule?
         ret, out = quiet_git(['submodule', 'status', self.dirname], self.subdir_root)
@@ -251,19 +275,9 @@ class Resolver:
             subprocess.check_call(['git', 'init', self.directory], cwd=self.subdir_root)
             subprocess.check_call(['git', 'remote', 'add', 'origin', self.wrap.get('url')],
                                   cwd=self.dirname)
-            revno = self.wrap.get('revision')
             subprocess.check_call(['git', 'fetch', *depth_option, 'origin', revno],
                                   cwd=self.dirname)
             subprocess.check_call(['git', 'checkout', revno], cwd=self.dirname)
-            if self.wrap.values.get('clone-recursive', '').lower() == 'true':
-                subprocess.check_call(['git', 'submodule', 'update',
-                                       '--init', '--checkout', '--recursive', *depth_option],
-                                      cwd=self.dirname)
-            push_url = self.wrap.values.get('push-url')
-            if push_url:
-                subprocess.check_call(['git', 'remote', 'set-url',
-                                       '--push', 'origin', push_url],
-                                      cwd=self.dirname)
         else:
             if not is_shallow:
                 subprocess.check_call(['git', 'clone', self.wrap.get('url'),
@@ -277,21 +291,19 @@ class Resolver:
                                        '--branch', revno,
                                        self.wrap.get('url'),
                                        self.directory], cwd=self.subdir_root)
-            if self.wrap.values.get('clone-recursive', '').lower() == 'true':
-                subprocess.check_call(['git', 'submodule', 'update',
-                                       '--init', '--checkout', '--recursive', *depth_option],
-                                      cwd=self.dirname)
-            push_url = self.wrap.values.get('push-url')
-            if push_url:
-                subprocess.check_call(['git', 'remote', 'set-url',
-                                       '--push', 'origin', push_url],
-                                      cwd=self.dirname)
+        if self.wrap.values.get('clone-recursive', '').lower() == 'true':
+            subprocess.check_call(['git', 'submodule', 'update',
+                                   '--init', '--checkout', '--recursive', *depth_option],
+                                  cwd=self.dirname)
+        push_url = self.wrap.values.get('push-url')
+        if push_url:
+            subprocess.check_call(['git', 'remote', 'set-url',
+                                   '--push', 'origin', push_url],
+                                  cwd=self.dirname)
 
     def is_git_full_commit_id(self, revno: str) -> bool:
-        result = False
-        if len(revno) in (40, 64): # 40 for sha1, 64 for upcoming sha256
-            result = all((ch in '0123456789AaBbCcDdEeFf' for ch in revno))
-        return result
+        # 40 for sha1, 64 for upcoming sha256
+        return len(revno) in (40, 64) and self.hex_digits.issuperset(revno)
 
     def get_hg(self) -> None:
         revno = self.wrap.get('revision')
@@ -307,14 +319,16 @@ class Resolver:
                                self.directory], cwd=self.subdir_root)
 
     def get_data(self, url: str) -> typing.Tuple[str, str]:
-        blocksize = 10 * 1024
+        # Read every block into the same buffer instead of a new bytes object
+        buf = bytearray(req_blocksize)
+        view = memoryview(buf)
         h = hashlib.sha256()
         tmpfile = tempfile.NamedTemporaryFile(mode='wb', dir=self.cachedir, delete=False)
         if url.startswith('https://wrapdb.mesonbuild.com'):
             resp = open_wrapdburl(url)
         else:
             try:
-                resp = urllib.request.urlopen(url, timeout=req_timeout)
+                resp = urlopen(url)
             except urllib.error.URLError:
                 raise WrapException('could not get {} is the internet available?'.format(url))
         with contextlib.closing(resp) as resp:
@@ -325,9 +339,10 @@ class Resolver:
             if dlsize is None:
                 print('Downloading file of unknown size.')
                 while True:
-                    block = resp.read(blocksize)
-                    if block == b'':
+                    n = resp.readinto(buf)
+                    if not n:
                         break
+                    block = view[:n]
                     h.update(block)
                     tmpfile.write(block)
                 hashvalue = h.hexdigest()
@@ -336,12 +351,13 @@ class Resolver:
             progress_bar = ProgressBar(bar_type='download', total=dlsize,
                                        desc='Downloading')
             while True:
-                block = resp.read(blocksize)
-                if block == b'':
+                n = resp.readinto(buf)
+                if not n:
                     break
+                block = view[:n]
                 h.update(block)
                 tmpfile.write(block)
-                progress_bar.update(len(block))
+                progress_bar.update(n)
             progress_bar.close()
             hashvalue = h.hexdigest()
         return hashvalue, tmpfile.name
@@ -350,7 +366,11 @@ class Resolver:
         expected = self.wrap.get(what + '_hash')
         h = hashlib.sha256()
         with open(path, 'rb') as f:
-            h.update(f.read())
+            while True:
+                block = f.read(req_blocksize)
+                if not block:
+                    break
+                h.update(block)
         dhash = h.hexdigest()
         if dhash != expected:
             raise WrapException('Incorrect hash for %s:\n %s expected\n %s actual.' % (what, expected, dhash))
@@ -364,7 +384,7 @@ class Resolver:
         if dhash != expected:
             os.remove(tmpfile)
             raise WrapException('Incorrect hash for %s:\n %s expected\n %s actual.' % (what, expected, dhash))
-        os.rename(tmpfile, ofname)
+        os.replace(tmpfile, ofname)
 
     def get_file_internal(self, what: str) -> str:
         filename = self.wrap.get(what + '_filename')
@@ -375,8 +395,7 @@ class Resolver:
             mlog.log('Using', mlog.bold(self.packagename), what, 'from cache.')
             return cache_path
 
-        if not os.path.isdir(self.cachedir):
-            os.mkdir(self.cachedir)
+        os.makedirs(self.cachedir, exist_ok=True)
         self.download(what, cache_path)
         return cache_path
 
@@ -393,10 +412,11 @@ class Resolver:
         """
         Copy directory tree. Overwrites also read only files.
         """
+        prefix_len = len(root_src_dir)
         for src_dir, _, files in os.walk(root_src_dir):
-            dst_dir = src_dir.replace(root_src_dir, root_dst_dir, 1)
-            if not os.path.exists(dst_dir):
-                os.makedirs(dst_dir)
+            # os.walk() yields paths below root_src_dir, so swap the prefix
+            dst_dir = root_dst_dir + src_dir[prefix_len:]
+            os.makedirs(dst_dir, exist_ok=True)
             for file_ in files:
                 src_file = os.path.join(src_dir, file_)
                 dst_file = os.path.join(dst_dir, file_)